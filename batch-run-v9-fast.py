@@ -1,9 +1,11 @@
+import os
 import subprocess
 import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 def main():
     parser = argparse.ArgumentParser()
@@ -12,6 +14,7 @@ def main():
     parser.add_argument('--n_gen', type=int, default=200)
     parser.add_argument('--results_dir', type=str, default='results')
     parser.add_argument('--n_jobs', type=int, default=1)
+    parser.add_argument('--n_parallel', type=int, default=1)
     args = parser.parse_args()
 
     project_root = Path(__file__).parent
@@ -24,22 +27,38 @@ def main():
 
     print(f"Batch run: {n_runs} seeds ({args.start_seed}-{args.end_seed})")
 
-    for i, seed in enumerate(seeds):
+    n_jobs = args.n_jobs
+    if args.n_parallel > 1:
+        cpu_count = os.cpu_count() or 1
+        jobs_per_run = max(1, cpu_count // args.n_parallel)
+        if n_jobs < 0 or n_jobs > jobs_per_run:
+            print(f"[WARN] --n_parallel={args.n_parallel} x --n_jobs={args.n_jobs} "
+                  f"oversubscribes {cpu_count} CPUs, using --n_jobs={jobs_per_run} per run")
+            n_jobs = jobs_per_run
+
+    def run_seed(i, seed):
         run_id = i + 1
         cmd = [python_exe, str(runner_script),
                f"--run_id={run_id}", f"--seed={seed}",
                f"--n_gen={args.n_gen}", f"--results_dir={args.results_dir}",
-               f"--n_jobs={args.n_jobs}"]
+               f"--n_jobs={n_jobs}"]
 
         run_start = time.time()
         result = subprocess.run(cmd, cwd=str(project_root))
         run_time = time.time() - run_start
 
         status = "ok" if result.returncode == 0 else "fail"
-        print(f"[{i+1}/{n_runs}] seed {seed}: {status} ({run_time:.0f}s)")
+        print(f"[{i+1}/{n_runs}] seed {seed}: {status} ({run_time:.0f}s)", flush=True)
+
+    if args.n_parallel > 1:
+        with ThreadPoolExecutor(max_workers=args.n_parallel) as executor:
+            list(executor.map(run_seed, range(n_runs), seeds))
+    else:
+        for i, seed in enumerate(seeds):
+            run_seed(i, seed)
 
-        if i < n_runs - 1:
-            time.sleep(2)
+            if i < n_runs - 1:
+                time.sleep(2)
 
     total = time.time() - batch_start
     print(f"Batch complete: {total/60:.1f} min")
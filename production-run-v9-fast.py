@@ -64,15 +64,14 @@ def main():
         G_final = res.G if hasattr(res, 'G') else None
     except EarlyStopException:
         early_stopped = True
-        n_gen_actual = callback.hv_history[-1][0] if callback.hv_history else 0
+        n_gen_actual = int(callback.hv_history[-1, 0]) if len(callback.hv_history) > 0 else 0
         F_final, X_final = callback.get_last_solution()
         G_final = np.zeros((len(F_final), problem.n_ieq_constr))
         for i in range(len(F_final)):
             decision_vars = {'n_pv_kw': X_final[i, 0], 'n_wind_mw': X_final[i, 1],
                            'e_battery_mwh': X_final[i, 2], 'p_diesel_mw': X_final[i, 3]}
             _, constraints, _ = simulate_system_fast(decision_vars, config, data_cache)
-            G_final[i] = [constraints['bounds'], constraints['area'], constraints['lpsp'],
-                         constraints['spinning_reserve'], constraints['grid_limits'], constraints['renewable_cap']]
+            G_final[i] = constraints['violations']
 
     elapsed = (datetime.now() - start_time).total_seconds()
 
@@ -86,7 +85,7 @@ def main():
     )
 
     create_all_plots(
-        metrics_history=callback.get_metrics_history(), pareto_data=pareto_metrics,
+        metrics_history=callback.get_metrics_history(), pareto_data=pareto_metrics.to_dataframe(),
         output_dir=results_dir, formats=['png', 'pdf', 'svg'], dpi=300
     )
 
@@ -0,0 +1,38 @@
+import numpy as np
+
+from utils.numba_compat import njit, prange, NUMBA_AVAILABLE, FASTMATH_FLAGS
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def spacing_diversity(F):
+
+    n, n_obj = F.shape
+    if n < 2:
+        return 0.0, 0.0
+
+    min_distances = np.empty(n)
+    for i in prange(n):
+        best = np.inf
+        for j in range(n):
+            if j == i:
+                continue
+            squared = 0.0
+            for k in range(n_obj):
+                delta = F[i, k] - F[j, k]
+                squared += delta * delta
+            if squared < best:
+                best = squared
+        min_distances[i] = np.sqrt(best)
+
+    d_bar = min_distances.mean()
+    spread = 0.0
+    for i in range(n):
+        spread += (min_distances[i] - d_bar) ** 2
+    sp = np.sqrt(spread / (n - 1))
+
+    div = 0.0
+    for k in range(n_obj):
+        centroid = F[:, k].mean()
+        for i in range(n):
+            div += (F[i, k] - centroid) ** 2
+
+    return sp, div
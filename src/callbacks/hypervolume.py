@@ -0,0 +1,29 @@
+from pymoo.indicators.hv import HV
+import numpy as np
+
+class CachedHV:
+
+    def __init__(self, ref_point):
+
+        self.ref_point = np.asarray(ref_point, dtype=np.float64)
+        self._indicator = HV(ref_point=self.ref_point)
+        self._last_F = None
+        self._last_hv = 0.0
+
+    def __call__(self, F):
+
+        F = np.asarray(F, dtype=np.float64)
+
+        if self._last_F is not None and np.array_equal(F, self._last_F):
+            return self._last_hv
+
+        hv = self._indicator(F)
+
+        self._last_F = F.copy()
+        self._last_hv = hv
+
+        return hv
+
+def get_hv_indicator(ref_point):
+
+    return CachedHV(ref_point)
@@ -1,8 +1,12 @@
 from pymoo.core.callback import Callback
-from pymoo.indicators.hv import HV
-from scipy.spatial.distance import cdist
+from scipy.spatial.distance import pdist, squareform
 import numpy as np
-from datetime import datetime
+import time
+
+from callbacks.hypervolume import get_hv_indicator
+from callbacks._metrics_jit import NUMBA_AVAILABLE, spacing_diversity
+
+IGD_CHUNK_BYTES = 256 * 1024
 
 class EarlyStopException(Exception):
     pass
@@ -19,20 +23,26 @@ class NSGA3ProgressCallbackFast(Callback):
         log_file=None
     ):
         super().__init__()
-        self.ref_point = ref_point
-        self.reference_front = reference_front
+        self.ref_point = np.asarray(ref_point, dtype=np.float64)
+        self.reference_front = (
+            np.ascontiguousarray(reference_front, dtype=np.float64)
+            if reference_front is not None else None
+        )
         self.log_every = log_every
         self.stagnation_generations = stagnation_generations
         self.stagnation_tolerance = stagnation_tolerance
         self.log_file = log_file
+        self._log_fp = open(log_file, 'a', buffering=1) if log_file else None
 
-        self.hv_indicator = HV(ref_point=ref_point)
-        self.hv_history = []
+        self.hv_indicator = get_hv_indicator(ref_point)
+        self._hv_arr = np.empty((256, 2))
+        self._hv_n = 0
         self.metrics_history = []
         self.last_F = None
         self.last_X = None
         self.best_hv = 0.0
         self.best_hv_gen = 0
+        self._t0 = time.perf_counter()
 
     def notify(self, algorithm):
         gen = algorithm.n_gen
@@ -48,7 +58,7 @@ class NSGA3ProgressCallbackFast(Callback):
         self.last_X = X.copy()
 
         hv = self._calculate_hv(F)
-        self.hv_history.append((gen, hv))
+        self._append_hv(gen, hv)
 
         if hv > self.best_hv * (1 + self.stagnation_tolerance):
             self.best_hv = hv
@@ -56,8 +66,7 @@ class NSGA3ProgressCallbackFast(Callback):
 
         if gen % self.log_every == 0 or gen == 1:
             igd_plus = self._calculate_igd_plus(F)
-            spacing = self._calculate_spacing(F)
-            diversity = self._calculate_diversity(F)
+            spacing, diversity = self._calculate_spacing_diversity(F)
 
             metrics = {
                 'generation': gen,
@@ -83,12 +92,25 @@ class NSGA3ProgressCallbackFast(Callback):
             self._log(f"Early stop: HV stagnant for {gen - self.best_hv_gen} gen (best at gen {self.best_hv_gen})")
             raise EarlyStopException()
 
+    @property
+    def hv_history(self):
+        return self._hv_arr[:self._hv_n]
+
+    def _append_hv(self, gen, hv):
+        if self._hv_n == len(self._hv_arr):
+            grown = np.empty((2 * len(self._hv_arr), 2))
+            grown[:self._hv_n] = self._hv_arr
+            self._hv_arr = grown
+        self._hv_arr[self._hv_n] = (gen, hv)
+        self._hv_n += 1
+
     def _calculate_hv(self, F):
-        if len(F) == 0:
+        valid = F[(F <= self.ref_point).all(axis=1)]
+        if len(valid) == 0:
             return 0.0
         try:
-            return self.hv_indicator(F)
-        except:
+            return self.hv_indicator(valid)
+        except (ValueError, IndexError):
             return 0.0
 
     def _calculate_igd_plus(self, pareto_front):
@@ -98,22 +120,38 @@ class NSGA3ProgressCallbackFast(Callback):
         if len(self.reference_front) == 0:
             return np.inf
 
+        pareto_front = np.ascontiguousarray(pareto_front, dtype=np.float64)
+
+        min_squared_distances = self._igd_plus_broadcast(pareto_front)
+
+        min_modified_distances = np.sqrt(min_squared_distances)
+
+        return float(np.mean(min_modified_distances))
+
+    def _igd_plus_broadcast(self, pareto_front):
         n_ref = self.reference_front.shape[0]
-        n_obtained = pareto_front.shape[0]
+        n_obtained, n_obj = pareto_front.shape
+        chunk = max(1, IGD_CHUNK_BYTES // (n_obtained * n_obj * pareto_front.itemsize))
+
+        min_squared_distances = np.empty(n_ref, dtype=np.float64)
+        for i0 in range(0, n_ref, chunk):
+            inferiority = np.maximum(
+                pareto_front[None, :, :] - self.reference_front[i0:i0 + chunk, None, :], 0.0
+            )
+            squared_distances = np.einsum('ijk,ijk->ij', inferiority, inferiority)
+            min_squared_distances[i0:i0 + chunk] = squared_distances.min(axis=1)
 
-        min_modified_distances = np.zeros(n_ref)
-        for i in range(n_ref):
-            z = self.reference_front[i, :]
-            inferiority = np.maximum(pareto_front - z, 0.0)
-            distances = np.linalg.norm(inferiority, axis=1)
-            min_modified_distances[i] = np.min(distances)
+        return min_squared_distances
 
-        return np.mean(min_modified_distances)
+    def _calculate_spacing_diversity(self, F):
+        if NUMBA_AVAILABLE:
+            return spacing_diversity(np.ascontiguousarray(F, dtype=np.float64))
+        return self._calculate_spacing(F), self._calculate_diversity(F)
 
     def _calculate_spacing(self, F):
         if len(F) < 2:
             return 0.0
-        distances = cdist(F, F, metric='euclidean')
+        distances = squareform(pdist(F, metric='euclidean'))
         np.fill_diagonal(distances, np.inf)
         min_distances = distances.min(axis=1)
         d_bar = min_distances.mean()
@@ -128,13 +166,19 @@ class NSGA3ProgressCallbackFast(Callback):
         return diversity
 
     def _log(self, msg):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        line = f"[{timestamp}] {msg}"
+        line = f"[{time.perf_counter() - self._t0:7.1f}s] {msg}"
         print(line, flush=True)
 
-        if self.log_file:
-            with open(self.log_file, 'a') as f:
-                f.write(line + '\n')
+        if self._log_fp is not None:
+            self._log_fp.write(line + '\n')
+
+    def close(self):
+        if getattr(self, '_log_fp', None) is not None:
+            self._log_fp.close()
+            self._log_fp = None
+
+    def __del__(self):
+        self.close()
 
     def get_last_solution(self):
         return self.last_F, self.last_X
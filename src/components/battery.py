@@ -1,3 +1,41 @@
+import numpy as np
+
+from utils.numba_compat import njit
+
+@njit(cache=True)
+def _simulate_kernel(power_demand_mw, duration_h, soc_initial, capacity_mwh,
+                     inv_capacity_mwh, p_max_mw, efficiency, min_soc):
+
+    n = power_demand_mw.shape[0]
+    power_actual_mw = np.zeros(n)
+    soc = soc_initial
+    inv_duration_h = 1.0 / duration_h if duration_h > 0 else 0.0
+
+    for t in range(n):
+        demand = power_demand_mw[t]
+
+        charge_request = -demand if demand < 0.0 else 0.0
+        charge = charge_request if charge_request < p_max_mw else p_max_mw
+        soc = soc + charge * duration_h * efficiency * inv_capacity_mwh
+        soc = 1.0 if soc > 1.0 else soc
+
+        discharge_request = demand if demand > 0.0 else 0.0
+        discharge = discharge_request if discharge_request < p_max_mw else p_max_mw
+        energy_from_battery_mwh = discharge * duration_h / efficiency
+
+        available_energy = capacity_mwh * (soc - min_soc)
+        available_energy = available_energy if available_energy > 0.0 else 0.0
+        energy_from_battery_mwh = (energy_from_battery_mwh
+                                   if energy_from_battery_mwh < available_energy
+                                   else available_energy)
+
+        soc = soc - energy_from_battery_mwh * inv_capacity_mwh
+        soc = min_soc if soc < min_soc else soc
+
+        power_actual_mw[t] = energy_from_battery_mwh * efficiency * inv_duration_h - charge
+
+    return power_actual_mw, soc
+
 class Battery:
 
     def __init__(self, capacity_mwh, c_rate=0.25, efficiency=0.90,
@@ -55,6 +93,24 @@ class Battery:
 
         return power_actual
 
+    def simulate(self, power_demand_mw, duration_h=1.0, soc_initial=None):
+
+        if soc_initial is None:
+            soc_initial = self.soc
+
+        inv_capacity = 1.0 / self.capacity_mwh if self.capacity_mwh > 0 else 0.0
+
+        power_actual_mw, soc_final = _simulate_kernel(
+            np.ascontiguousarray(power_demand_mw, dtype=np.float64),
+            float(duration_h), float(soc_initial), float(self.capacity_mwh),
+            float(inv_capacity), float(self.p_max_mw), float(self.efficiency),
+            float(1.0 - self.dod_max)
+        )
+
+        self.soc = soc_final
+
+        return power_actual_mw, soc_final
+
     def get_available_energy(self):
 
         min_soc = 1 - self.dod_max
@@ -7,9 +7,9 @@ class LoadProfile:
 
         self.csv_path = csv_path
 
-        df = pd.read_csv(csv_path)
+        df = pd.read_csv(csv_path, usecols=['Load_MW'], dtype={'Load_MW': np.float64})
 
-        self.load_mw = df['Load_MW'].values
+        self.load_mw = df['Load_MW'].to_numpy()
 
     def get_load(self, timestep):
 
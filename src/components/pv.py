@@ -1,3 +1,5 @@
+import numpy as np
+
 class SolarPV:
 
     def __init__(self, capacity_kw, tilt_deg=60, temp_coeff=-0.004, name="SolarPV"):
@@ -20,6 +22,12 @@ class SolarPV:
 
         return p_output_mw
 
+    def generate_year(self, cf_pv, temperature_c):
+
+        derating_factor = 1.0 + self.temp_coeff * (np.asarray(temperature_c) - 25.0)
+
+        return np.maximum(self.capacity_kw * np.asarray(cf_pv) * derating_factor, 0.0) / 1000.0
+
     def __repr__(self):
 
         return (f"SolarPV(name='{self.name}', capacity={self.capacity_kw}kW, "
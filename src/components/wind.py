@@ -1,3 +1,5 @@
+import numpy as np
+
 class WindTurbine:
 
     def __init__(self, capacity_mw, hub_height_m=100,
@@ -13,24 +15,19 @@ class WindTurbine:
 
     def power_curve(self, wind_speed_ms):
 
-        if wind_speed_ms < 0:
-            return 0.0
-
-        if wind_speed_ms < self.cut_in_ms:
-            return 0.0
+        return float(self.power_curve_array(wind_speed_ms))
 
-        if wind_speed_ms < self.rated_ms:
+    def power_curve_array(self, wind_speed_ms):
 
-            normalized_speed = ((wind_speed_ms - self.cut_in_ms) /
-                               (self.rated_ms - self.cut_in_ms))
+        v = np.asarray(wind_speed_ms, dtype=np.float64)
 
-            power_mw = self.capacity_mw * (normalized_speed ** 3)
-            return power_mw
+        normalized_speed = (v - self.cut_in_ms) / (self.rated_ms - self.cut_in_ms)
+        p_ramp_mw = self.capacity_mw * normalized_speed ** 3
 
-        if wind_speed_ms < self.cut_out_ms:
-            return self.capacity_mw
+        power_mw = np.where((v >= self.cut_in_ms) & (v < self.rated_ms), p_ramp_mw, 0.0)
+        power_mw = np.where((v >= self.rated_ms) & (v < self.cut_out_ms), self.capacity_mw, power_mw)
 
-        return 0.0
+        return power_mw
 
     def generate(self, cf_wind):
 
@@ -1,9 +1,14 @@
 from .constraint_functions import (
     constraint_bounds,
     constraint_area,
+    make_constraint_area,
     constraint_lpsp,
     constraint_spinning_reserve,
     constraint_grid_limits,
     constraint_renewable_cap
 )
-from .constraint_validator import validate_solution
+from .constraint_validator import (
+    validate_solution,
+    validate_population,
+    CONSTRAINT_NAMES
+)
@@ -1,3 +1,5 @@
+import numpy as np
+
 def constraint_bounds(x, bounds):
 
     violation = 0.0
@@ -8,11 +10,7 @@ def constraint_bounds(x, bounds):
 
         value = x[var_name]
 
-        if value < lower:
-            violation += abs(value - lower)
-
-        if value > upper:
-            violation += abs(value - upper)
+        violation = violation + np.maximum(lower - value, 0.0) + np.maximum(value - upper, 0.0)
 
     return violation
 
@@ -20,16 +18,31 @@ def constraint_area(x, area_params):
     area_pv = x.get('n_pv_kw', 0) * area_params['area_pv_per_kw']
     area_wind = x.get('n_wind_mw', 0) * area_params['area_wind_per_mw']
 
-    violation_pv = max(area_pv - area_params.get('area_available_pv_m2', float('inf')), 0.0)
-    violation_wind = max(area_wind - area_params.get('area_available_wind_m2', float('inf')), 0.0)
+    violation_pv = np.maximum(area_pv - area_params.get('area_available_pv_m2', float('inf')), 0.0)
+    violation_wind = np.maximum(area_wind - area_params.get('area_available_wind_m2', float('inf')), 0.0)
 
     return violation_pv + violation_wind
 
+def make_constraint_area(area_params):
+    area_pv_per_kw = area_params['area_pv_per_kw']
+    area_wind_per_mw = area_params['area_wind_per_mw']
+    area_available_pv_m2 = area_params.get('area_available_pv_m2', float('inf'))
+    area_available_wind_m2 = area_params.get('area_available_wind_m2', float('inf'))
+
+    def constraint_area_specialized(x):
+        area_pv = x.get('n_pv_kw', 0) * area_pv_per_kw
+        area_wind = x.get('n_wind_mw', 0) * area_wind_per_mw
+
+        return (np.maximum(area_pv - area_available_pv_m2, 0.0) +
+                np.maximum(area_wind - area_available_wind_m2, 0.0))
+
+    return constraint_area_specialized
+
 def constraint_lpsp(simulation_results, lpsp_limit=0.05):
 
     lpsp = simulation_results.get('lpsp', 0.0)
 
-    violation = max(lpsp - lpsp_limit, 0.0)
+    violation = np.maximum(lpsp - lpsp_limit, 0.0)
 
     return violation
 
@@ -43,7 +56,7 @@ def constraint_spinning_reserve(system, reserve_fraction=0.15):
 
     reserve_available = p_diesel_online + p_battery_discharge - p_load_avg
 
-    violation = max(reserve_required - reserve_available, 0.0)
+    violation = np.maximum(reserve_required - reserve_available, 0.0)
 
     return violation
 
@@ -55,8 +68,8 @@ def constraint_grid_limits(system, grid_limits):
     p_max_import = grid_limits['p_max_import_mw']
     p_max_export = grid_limits['p_max_export_mw']
 
-    violation_import = max(p_grid_buy - p_max_import, 0.0)
-    violation_export = max(p_grid_sell - p_max_export, 0.0)
+    violation_import = np.maximum(p_grid_buy - p_max_import, 0.0)
+    violation_export = np.maximum(p_grid_sell - p_max_export, 0.0)
 
     violation = violation_import + violation_export
 
@@ -72,6 +85,6 @@ def constraint_renewable_cap(system, policy):
 
     renewable_cap_mw = policy['renewable_fraction_max'] * p_load_avg
 
-    violation = max(renewable_total_mw - renewable_cap_mw, 0.0)
+    violation = np.maximum(renewable_total_mw - renewable_cap_mw, 0.0)
 
     return violation
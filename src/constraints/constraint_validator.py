@@ -1,3 +1,5 @@
+import numpy as np
+
 from .constraint_functions import (
     constraint_bounds,
     constraint_area,
@@ -7,34 +9,54 @@ from .constraint_functions import (
     constraint_renewable_cap
 )
 
-def validate_solution(x, bounds, area_params, simulation_results, policy,
-                      grid_limits, reserve_fraction, lpsp_limit, tolerance=1e-6):
-    violations = {}
-    violations['bounds'] = constraint_bounds(x, bounds)
-    violations['area'] = constraint_area(x, area_params)
-    violations['lpsp'] = constraint_lpsp(simulation_results, lpsp_limit)
+CONSTRAINT_NAMES = (
+    'bounds',
+    'area',
+    'lpsp',
+    'spinning_reserve',
+    'grid_limits',
+    'renewable_cap'
+)
 
+def validate_population(X, bounds, area_params, simulation_results, policy,
+                        grid_limits, reserve_fraction, lpsp_limit, tolerance=1e-6,
+                        area_fn=None):
     system_for_reserve = {
-        'p_diesel_online_mw': x.get('p_diesel_online_mw', 0.0),
-        'p_battery_discharge_mw': x.get('p_battery_discharge_mw', 0.0),
-        'p_load_avg_mw': x.get('p_load_avg_mw', 0.0)
+        'p_diesel_online_mw': X.get('p_diesel_online_mw', 0.0),
+        'p_battery_discharge_mw': X.get('p_battery_discharge_mw', 0.0),
+        'p_load_avg_mw': X.get('p_load_avg_mw', 0.0)
     }
-    violations['spinning_reserve'] = constraint_spinning_reserve(system_for_reserve, reserve_fraction)
 
     system_for_grid = {
-        'p_grid_buy_mw': x.get('p_grid_buy_mw', 0.0),
-        'p_grid_sell_mw': x.get('p_grid_sell_mw', 0.0),
-        'grid_connected': x.get('grid_connected', False)
+        'p_grid_buy_mw': X.get('p_grid_buy_mw', 0.0),
+        'p_grid_sell_mw': X.get('p_grid_sell_mw', 0.0),
+        'grid_connected': X.get('grid_connected', False)
     }
-    violations['grid_limits'] = constraint_grid_limits(system_for_grid, grid_limits)
 
     system_for_renewable = {
-        'p_pv_installed_kw': x.get('p_pv_installed_kw', 0.0),
-        'p_wind_installed_mw': x.get('p_wind_installed_mw', 0.0),
-        'p_load_avg_mw': x.get('p_load_avg_mw', 0.0)
+        'p_pv_installed_kw': X.get('p_pv_installed_kw', 0.0),
+        'p_wind_installed_mw': X.get('p_wind_installed_mw', 0.0),
+        'p_load_avg_mw': X.get('p_load_avg_mw', 0.0)
     }
-    violations['renewable_cap'] = constraint_renewable_cap(system_for_renewable, policy)
 
-    total_cv = sum(max(v, 0.0) for v in violations.values())
+    violations = np.column_stack(np.broadcast_arrays(
+        constraint_bounds(X, bounds),
+        area_fn(X) if area_fn is not None else constraint_area(X, area_params),
+        constraint_lpsp(simulation_results, lpsp_limit),
+        constraint_spinning_reserve(system_for_reserve, reserve_fraction),
+        constraint_grid_limits(system_for_grid, grid_limits),
+        constraint_renewable_cap(system_for_renewable, policy)
+    )).astype(np.float64)
+
+    total_cv = np.maximum(violations, 0.0).sum(axis=1)
     is_feasible = (total_cv <= tolerance)
     return is_feasible, total_cv, violations
+
+def validate_solution(x, bounds, area_params, simulation_results, policy,
+                      grid_limits, reserve_fraction, lpsp_limit, tolerance=1e-6,
+                      area_fn=None):
+    is_feasible, total_cv, violations = validate_population(
+        x, bounds, area_params, simulation_results, policy,
+        grid_limits, reserve_fraction, lpsp_limit, tolerance, area_fn
+    )
+    return bool(is_feasible[0]), float(total_cv[0]), violations[0]
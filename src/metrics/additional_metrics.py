@@ -1,36 +1,39 @@
 import numpy as np
 from typing import Dict, Tuple
 
+def _re_penetration_from_totals(re_annual: float, load_annual: float) -> float:
+
+    if load_annual <= 0:
+        return 0.0
+
+    re_penetration = (re_annual / load_annual) * 100.0
+    return re_penetration
+
 def calculate_re_penetration(
     p_pv_hourly: np.ndarray,
     p_wind_hourly: np.ndarray,
     p_load_hourly: np.ndarray
 ) -> float:
 
-    re_annual = np.sum(p_pv_hourly + p_wind_hourly)
-    load_annual = np.sum(p_load_hourly)
-
-    if load_annual <= 0:
-        return 0.0
+    re_annual = float(p_pv_hourly.sum()) + float(p_wind_hourly.sum())
+    load_annual = float(p_load_hourly.sum())
 
-    re_penetration = (re_annual / load_annual) * 100.0
-    return re_penetration
+    return _re_penetration_from_totals(re_annual, load_annual)
 
-def calculate_excess_power(
+def _excess_annual(
     p_pv_hourly: np.ndarray,
     p_wind_hourly: np.ndarray,
     p_load_hourly: np.ndarray,
-    p_battery_charge_hourly: np.ndarray,
-    p_diesel_hourly: np.ndarray
-) -> Tuple[float, float]:
+    p_battery_charge_hourly: np.ndarray
+) -> float:
 
-    re_available = p_pv_hourly + p_wind_hourly
-    demand = p_load_hourly + p_battery_charge_hourly
+    excess_hourly = np.add(p_pv_hourly, p_wind_hourly, dtype=np.float64)
+    np.subtract(excess_hourly, p_load_hourly + p_battery_charge_hourly, out=excess_hourly)
+    np.maximum(excess_hourly, 0, out=excess_hourly)
 
-    excess_hourly = np.maximum(0, re_available - demand)
-    excess_annual = np.sum(excess_hourly)
+    return float(excess_hourly.sum())
 
-    generation_annual = np.sum(p_pv_hourly + p_wind_hourly + p_diesel_hourly)
+def _excess_power_from_totals(excess_annual: float, generation_annual: float) -> Tuple[float, float]:
 
     if generation_annual <= 0:
         return 0.0, 0.0
@@ -38,6 +41,21 @@ def calculate_excess_power(
     excess_pct = (excess_annual / generation_annual) * 100.0
     return excess_pct, excess_annual
 
+def calculate_excess_power(
+    p_pv_hourly: np.ndarray,
+    p_wind_hourly: np.ndarray,
+    p_load_hourly: np.ndarray,
+    p_battery_charge_hourly: np.ndarray,
+    p_diesel_hourly: np.ndarray
+) -> Tuple[float, float]:
+
+    excess_annual = _excess_annual(p_pv_hourly, p_wind_hourly, p_load_hourly, p_battery_charge_hourly)
+
+    generation_annual = (float(p_pv_hourly.sum()) + float(p_wind_hourly.sum()) +
+                         float(p_diesel_hourly.sum()))
+
+    return _excess_power_from_totals(excess_annual, generation_annual)
+
 def calculate_lcoe(
     npc: float,
     load_annual_kwh: float,
@@ -51,8 +69,8 @@ def calculate_lcoe(
     lcoe = npc / total_energy
     return lcoe
 
-def calculate_fuel_consumption(
-    p_diesel_hourly: np.ndarray,
+def _fuel_consumption_from_total(
+    diesel_annual_mwh: float,
     diesel_efficiency: float = 0.30,
     fuel_energy_content_kwh_per_liter: float = 10.0
 ) -> Tuple[float, float]:
@@ -60,7 +78,6 @@ def calculate_fuel_consumption(
     if diesel_efficiency <= 0:
         return 0.0, 0.0
 
-    diesel_annual_mwh = np.sum(p_diesel_hourly)
     diesel_annual_kwh = diesel_annual_mwh * 1000
     fuel_input_kwh = diesel_annual_kwh / diesel_efficiency
     fuel_liters = fuel_input_kwh / fuel_energy_content_kwh_per_liter
@@ -70,6 +87,16 @@ def calculate_fuel_consumption(
 
     return fuel_liters, fuel_kg
 
+def calculate_fuel_consumption(
+    p_diesel_hourly: np.ndarray,
+    diesel_efficiency: float = 0.30,
+    fuel_energy_content_kwh_per_liter: float = 10.0
+) -> Tuple[float, float]:
+
+    return _fuel_consumption_from_total(
+        np.sum(p_diesel_hourly), diesel_efficiency, fuel_energy_content_kwh_per_liter
+    )
+
 def calculate_all_additional_metrics(
     simulation_results: Dict,
     npc: float,
@@ -82,12 +109,18 @@ def calculate_all_additional_metrics(
     p_battery_charge = simulation_results['p_battery_charge_hourly']
     p_diesel = simulation_results['p_diesel_hourly']
 
-    load_annual_kwh = float(np.sum(p_load)) * 1000
+    pv_annual = float(p_pv.sum())
+    wind_annual = float(p_wind.sum())
+    load_annual = float(p_load.sum())
+    diesel_annual = float(p_diesel.sum())
+
+    load_annual_kwh = load_annual * 1000
 
-    re_pct = calculate_re_penetration(p_pv, p_wind, p_load)
+    re_pct = _re_penetration_from_totals(pv_annual + wind_annual, load_annual)
 
-    excess_pct, excess_mwh = calculate_excess_power(
-        p_pv, p_wind, p_load, p_battery_charge, p_diesel
+    excess_pct, excess_mwh = _excess_power_from_totals(
+        _excess_annual(p_pv, p_wind, p_load, p_battery_charge),
+        pv_annual + wind_annual + diesel_annual
     )
 
     lcoe = calculate_lcoe(
@@ -95,8 +128,8 @@ def calculate_all_additional_metrics(
         config.get('lifetime_years', 25)
     )
 
-    fuel_liters, fuel_kg = calculate_fuel_consumption(
-        p_diesel,
+    fuel_liters, fuel_kg = _fuel_consumption_from_total(
+        diesel_annual,
         config.get('diesel_efficiency', 0.30)
     )
 
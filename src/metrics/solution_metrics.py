@@ -1,15 +1,69 @@
 import numpy as np
+import pandas as pd
+from dataclasses import dataclass, fields
+from typing import NamedTuple, Optional
 from simulation.system_simulator_fast import simulate_system_fast
 from simulation.data_cache import get_data_cache
 from metrics.additional_metrics import calculate_all_additional_metrics
 
+class SolutionMetrics(NamedTuple):
+    solution_index: int
+    pv_kw: float
+    wind_mw: float
+    battery_mwh: float
+    diesel_mw: float
+    npc_cad: float
+    lpsp: float
+    co2_kg: float
+    gini: float
+    re_penetration_pct: float
+    excess_power_pct: float
+    excess_power_mwh: float
+    lcoe_cad_per_kwh: float
+    fuel_consumption_liters: float
+    fuel_consumption_kg: float
+    load_annual_kwh: float
+    is_feasible: bool
+    total_violation: float
+
+@dataclass
+class ParetoFrontMetrics:
+    solution_index: np.ndarray
+    pv_kw: np.ndarray
+    wind_mw: np.ndarray
+    battery_mwh: np.ndarray
+    diesel_mw: np.ndarray
+    npc_cad: np.ndarray
+    lpsp: np.ndarray
+    co2_kg: np.ndarray
+    gini: np.ndarray
+    re_penetration_pct: np.ndarray
+    excess_power_pct: np.ndarray
+    excess_power_mwh: np.ndarray
+    lcoe_cad_per_kwh: np.ndarray
+    fuel_consumption_liters: np.ndarray
+    fuel_consumption_kg: np.ndarray
+    load_annual_kwh: np.ndarray
+    is_feasible: np.ndarray
+    total_violation: np.ndarray
+
+    def __len__(self):
+
+        return len(self.solution_index)
+
+    def to_dataframe(self) -> pd.DataFrame:
+
+        return pd.DataFrame({field.name: getattr(self, field.name) for field in fields(self)})
+
 def calculate_solution_metrics(
     decision_vector: np.ndarray,
     objectives: np.ndarray,
     constraints: np.ndarray,
     system_config: dict,
-    solution_index: int = 0
-) -> dict:
+    solution_index: int = 0,
+    is_feasible: Optional[bool] = None,
+    total_violation: Optional[float] = None
+) -> SolutionMetrics:
 
     pv_kw = decision_vector[0]
     wind_mw = decision_vector[1]
@@ -54,62 +108,78 @@ def calculate_solution_metrics(
         config=system_config
     )
 
-    is_feasible = np.all(constraints <= 0) if len(constraints) > 0 else True
-    total_violation = np.sum(np.maximum(constraints, 0)) if len(constraints) > 0 else 0.0
-
-    solution_dict = {
-        'solution_index': solution_index,
-        'pv_kw': float(pv_kw),
-        'wind_mw': float(wind_mw),
-        'battery_mwh': float(battery_mwh),
-        'diesel_mw': float(diesel_mw),
-        'npc_cad': float(npc),
-        'lpsp': float(lpsp),
-        'co2_kg': float(co2),
-        'gini': float(gini),
-        're_penetration_pct': additional_metrics['re_penetration_pct'],
-        'excess_power_pct': additional_metrics['excess_power_pct'],
-        'excess_power_mwh': additional_metrics['excess_power_mwh'],
-        'lcoe_cad_per_kwh': additional_metrics['lcoe_cad_per_kwh'],
-        'fuel_consumption_liters': additional_metrics['fuel_consumption_liters'],
-        'fuel_consumption_kg': additional_metrics['fuel_consumption_kg'],
-        'load_annual_kwh': additional_metrics['load_annual_kwh'],
-        'is_feasible': bool(is_feasible),
-        'total_violation': float(total_violation)
-    }
+    if is_feasible is None:
+        is_feasible = np.all(constraints <= 0) if len(constraints) > 0 else True
+    if total_violation is None:
+        total_violation = np.sum(np.maximum(constraints, 0)) if len(constraints) > 0 else 0.0
+
+    solution = SolutionMetrics(
+        solution_index=solution_index,
+        pv_kw=float(pv_kw),
+        wind_mw=float(wind_mw),
+        battery_mwh=float(battery_mwh),
+        diesel_mw=float(diesel_mw),
+        npc_cad=float(npc),
+        lpsp=float(lpsp),
+        co2_kg=float(co2),
+        gini=float(gini),
+        re_penetration_pct=additional_metrics['re_penetration_pct'],
+        excess_power_pct=additional_metrics['excess_power_pct'],
+        excess_power_mwh=additional_metrics['excess_power_mwh'],
+        lcoe_cad_per_kwh=additional_metrics['lcoe_cad_per_kwh'],
+        fuel_consumption_liters=additional_metrics['fuel_consumption_liters'],
+        fuel_consumption_kg=additional_metrics['fuel_consumption_kg'],
+        load_annual_kwh=additional_metrics['load_annual_kwh'],
+        is_feasible=bool(is_feasible),
+        total_violation=float(total_violation)
+    )
 
-    if not (0 <= solution_dict['re_penetration_pct'] <= 100):
+    if not (0 <= solution.re_penetration_pct <= 100):
         raise ValueError(
-            f"Solution {solution_index}: RE% = {solution_dict['re_penetration_pct']} "
+            f"Solution {solution_index}: RE% = {solution.re_penetration_pct} "
             "is OUT OF RANGE [0,100]. Calculation error."
         )
 
-    if solution_dict['lcoe_cad_per_kwh'] <= 0:
+    if solution.lcoe_cad_per_kwh <= 0:
         raise ValueError(
-            f"Solution {solution_index}: LCOE = {solution_dict['lcoe_cad_per_kwh']} "
+            f"Solution {solution_index}: LCOE = {solution.lcoe_cad_per_kwh} "
             "is NON-POSITIVE. Calculation error."
         )
 
-    return solution_dict
+    return solution
 
 def calculate_pareto_front_metrics(
     F: np.ndarray,
     X: np.ndarray,
     G: np.ndarray,
     system_config: dict
-) -> list:
+) -> ParetoFrontMetrics:
 
     n_solutions = F.shape[0]
-    pareto_metrics = []
+    columns = {
+        name: np.empty(n_solutions, dtype=dtype)
+        for name, dtype in SolutionMetrics.__annotations__.items()
+    }
+
+    has_constraints = G is not None and len(G) > 0
+    if has_constraints:
+        feasible_all = (G <= 0).all(axis=1)
+        violation_all = np.maximum(G, 0).sum(axis=1)
+    else:
+        feasible_all = np.ones(n_solutions, dtype=bool)
+        violation_all = np.zeros(n_solutions)
 
     for i in range(n_solutions):
         solution_metrics = calculate_solution_metrics(
             decision_vector=X[i, :],
             objectives=F[i, :],
-            constraints=G[i, :] if G is not None and len(G) > 0 else np.array([]),
+            constraints=G[i, :] if has_constraints else np.array([]),
             system_config=system_config,
-            solution_index=i
+            solution_index=i,
+            is_feasible=feasible_all[i],
+            total_violation=violation_all[i]
         )
-        pareto_metrics.append(solution_metrics)
+        for name, value in zip(SolutionMetrics._fields, solution_metrics):
+            columns[name][i] = value
 
-    return pareto_metrics
+    return ParetoFrontMetrics(**columns)
@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+import numpy as np
+
+@lru_cache(maxsize=None)
+def strata(n_households):
+
+    n_low = int(n_households * 0.40)
+    n_mid = int(n_households * 0.40)
+    n_high = n_households - n_low - n_mid
+
+    return n_low, n_mid, n_high
+
+def draw_strata(rng, n_households, ranges):
+
+    values = np.empty(n_households)
+
+    start = 0
+    for (low, high), size in zip(ranges, strata(n_households)):
+        values[start:start + size] = rng.uniform(low, high, size)
+        start += size
+
+    return values
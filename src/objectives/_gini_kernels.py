@@ -0,0 +1,62 @@
+import numpy as np
+
+from utils.numba_compat import njit, NUMBA_AVAILABLE, FASTMATH_FLAGS
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _gini_sorted_jit(sorted_x, clip):
+
+    n = sorted_x.shape[0]
+
+    cumulative = 0.0
+    cumulative_sum = 0.0
+    for i in range(n):
+        cumulative += sorted_x[i]
+        cumulative_sum += cumulative
+
+    gini = (n + 1 - 2.0 * cumulative_sum / cumulative) / n
+
+    if clip:
+        gini = 0.0 if gini < 0.0 else (1.0 if gini > 1.0 else gini)
+
+    return gini
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _gini_core_jit(x, clip):
+
+    return _gini_sorted_jit(np.sort(x), clip)
+
+_INDEX_CACHE = {}
+
+def _idx(n):
+
+    index = _INDEX_CACHE.get(n)
+    if index is None:
+        index = _INDEX_CACHE.setdefault(n, np.arange(1, n + 1, dtype=np.float64))
+
+    return index
+
+def _gini_sorted_numpy(sorted_x, clip):
+
+    n = len(sorted_x)
+    total = sorted_x.sum()
+
+    gini = (2 * np.dot(_idx(n), sorted_x) - (n + 1) * total) / (n * total)
+
+    if clip:
+        gini = max(0.0, min(gini, 1.0))
+
+    return float(gini)
+
+def gini_core(x, clip=True):
+
+    if NUMBA_AVAILABLE:
+        return _gini_core_jit(np.ascontiguousarray(x, dtype=np.float64), clip)
+
+    return _gini_sorted_numpy(np.sort(x), clip)
+
+def gini_sorted(sorted_x, clip=True):
+
+    if NUMBA_AVAILABLE:
+        return _gini_sorted_jit(np.ascontiguousarray(sorted_x, dtype=np.float64), clip)
+
+    return _gini_sorted_numpy(sorted_x, clip)
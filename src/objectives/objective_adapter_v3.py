@@ -1,11 +1,11 @@
 import numpy as np
 from typing import Dict, Tuple
+from objectives._gini_common import draw_strata
 from objectives.objective_functions_v3_COMPLETE import (
     objective_npc_v3,
     objective_lpsp_v3,
-    objective_co2_v3,
     objective_gini_spatial_v3,
-    disaggregate_load_to_households_simplified,
+    DIESEL_CO2_KG_PER_LITER,
 
     LIFETIME_PV,
     LIFETIME_WIND,
@@ -67,6 +67,30 @@ def adapt_co2_v1_to_v3(dispatch_v1: Dict) -> Dict:
 
     return dispatch_v3
 
+_DRAWS_CACHE = {}
+
+def _get_household_draws(n_households: int, random_seed: int) -> Tuple[np.ndarray, np.ndarray]:
+
+    key = (n_households, random_seed)
+    draws = _DRAWS_CACHE.get(key)
+    if draws is not None:
+        return draws
+
+    rng = np.random.RandomState(random_seed)
+    scaling = rng.uniform(0.5, 1.5, n_households)
+    weights = scaling / scaling.sum()
+
+    rng = np.random.RandomState(random_seed)
+
+    multipliers = draw_strata(rng, n_households, [(0.5, 1.0), (0.8, 1.2), (1.2, 2.0)])
+
+    rng.shuffle(multipliers)
+
+    weights.setflags(write=False)
+    multipliers.setflags(write=False)
+
+    return _DRAWS_CACHE.setdefault(key, (weights, multipliers))
+
 def adapt_gini_v1_to_v3(
     hourly_costs: np.ndarray,
     aggregate_load_mwh: np.ndarray,
@@ -75,32 +99,13 @@ def adapt_gini_v1_to_v3(
     random_seed: int = 42
 ) -> np.ndarray:
 
-    household_loads_mwh = disaggregate_load_to_households_simplified(
-        aggregate_load_mwh,
-        n_households=n_households,
-        random_seed=random_seed
-    )
-
-    total_load_per_household = household_loads_mwh.sum(axis=1)
+    weights, multipliers = _get_household_draws(n_households, random_seed)
+    total_load_per_household = weights * aggregate_load_mwh.sum()
 
     total_renewable = renewable_production_mwh.sum()
 
-    np.random.seed(random_seed)
-
     base_renewable_fraction = total_renewable / total_load_per_household.sum()
 
-    n_low = int(n_households * 0.40)
-    n_mid = int(n_households * 0.40)
-    n_high = n_households - n_low - n_mid
-
-    multipliers = np.concatenate([
-        np.random.uniform(0.5, 1.0, n_low),
-        np.random.uniform(0.8, 1.2, n_mid),
-        np.random.uniform(1.2, 2.0, n_high)
-    ])
-
-    np.random.shuffle(multipliers)
-
     renewable_allocated_per_household = total_load_per_household * base_renewable_fraction * multipliers
 
     renewable_allocated_per_household *= (total_renewable / renewable_allocated_per_household.sum())
@@ -118,14 +123,12 @@ def objective_npc_adapted(system_v1: Dict, components_info: Dict) -> float:
     system_v3 = adapt_npc_v1_to_v3(system_v1, components_info)
     return objective_npc_v3(system_v3)
 
-def objective_lpsp_adapted(dispatch_v1: Dict) -> float:
-
-    return objective_lpsp_v3(dispatch_v1)
+objective_lpsp_adapted = objective_lpsp_v3
 
 def objective_co2_adapted(dispatch_v1: Dict, lifetime_years: int = 25) -> float:
 
-    dispatch_v3 = adapt_co2_v1_to_v3(dispatch_v1)
-    return objective_co2_v3(dispatch_v3, lifetime_years)
+    fuel_diesel_liters = dispatch_v1.get('fuel_diesel_mmbtu_annual', 0.0) / DIESEL_LHV_MMBTU_PER_LITER
+    return (fuel_diesel_liters * DIESEL_CO2_KG_PER_LITER * lifetime_years) / 1000.0
 
 def objective_gini_adapted(
     hourly_costs: np.ndarray,
@@ -1,5 +1,75 @@
+from functools import lru_cache
+
 import numpy as np
 
+from objectives._gini_common import draw_strata
+from objectives._gini_kernels import gini_core, gini_sorted
+
+@lru_cache(maxsize=16)
+def _present_worth_factor(discount_rate, lifetime):
+
+    if discount_rate == 0:
+        return lifetime
+
+    return (1 - (1 + discount_rate) ** (-lifetime)) / discount_rate
+
+@lru_cache(maxsize=16)
+def _discount_factor(discount_rate, year):
+
+    return (1 + discount_rate) ** year
+
+# Household profiles are fixed per (n_households, seed). They are drawn once from a
+# private RandomState, which reproduces the np.random.seed() stream without touching
+# the global generator. Spatial multipliers and theja capture factors are stored
+# sorted: both Gini pipelines are monotone in them, so their outputs come out sorted.
+_MULT_CACHE = {}
+
+def _cached_profile(key, draw):
+
+    profile = _MULT_CACHE.get(key)
+    if profile is None:
+        profile = draw()
+        for array in profile:
+            array.setflags(write=False)
+        profile = _MULT_CACHE.setdefault(key, profile)
+
+    return profile
+
+def _get_sorted_multipliers(n_households, seed):
+
+    def draw():
+        rng = np.random.RandomState(seed)
+
+        multipliers = draw_strata(rng, n_households, [(0.5, 1.0), (0.8, 1.2), (1.2, 2.0)])
+
+        return (np.sort(multipliers),)
+
+    return _cached_profile(('spatial', n_households, seed), draw)[0]
+
+def _get_burden_profile(n_households, seed):
+
+    def draw():
+        rng = np.random.RandomState(seed)
+
+        incomes = draw_strata(rng, n_households, [(18000, 36000), (40000, 70000), (70000, 110000)])
+
+        consumption = draw_strata(rng, n_households, [(0.7, 1.0), (0.9, 1.1), (1.1, 1.4)])
+
+        return incomes, consumption / consumption.sum()
+
+    return _cached_profile(('burden', n_households, seed), draw)
+
+def _get_sorted_capture(n_households, seed):
+
+    def draw():
+        rng = np.random.RandomState(seed)
+
+        capture = draw_strata(rng, n_households, [(0.3, 0.6), (0.7, 1.1), (1.2, 2.0)])
+
+        return (np.sort(capture),)
+
+    return _cached_profile(('theja', n_households, seed), draw)[0]
+
 def objective_npc(system):
 
     capital = system['capital_cost_usd']
@@ -10,16 +80,13 @@ def objective_npc(system):
     discount_rate = system['discount_rate']
     lifetime = system['lifetime_years']
 
-    if discount_rate == 0:
-        pwf = lifetime
-    else:
-        pwf = (1 - (1 + discount_rate) ** (-lifetime)) / discount_rate
+    pwf = _present_worth_factor(discount_rate, lifetime)
 
     pv_fuel = fuel_annual * pwf
     pv_om = om_annual * pwf
 
     if replacement_cost and replacement_year:
-        pv_replacement = replacement_cost / ((1 + discount_rate) ** replacement_year)
+        pv_replacement = replacement_cost / _discount_factor(discount_rate, replacement_year)
     else:
         pv_replacement = 0.0
 
@@ -57,34 +124,16 @@ def objective_co2(dispatch_results, lifetime_years=25):
 
 def objective_gini(cost_per_hour):
 
-    n = len(cost_per_hour)
     total_cost = np.sum(cost_per_hour)
 
     if total_cost == 0:
         return 0.0
 
-    sorted_costs = np.sort(cost_per_hour)
-
-    index = np.arange(1, n + 1)
-
-    gini = (2 * np.sum(index * sorted_costs) - (n + 1) * total_cost) / (n * total_cost)
-
-    return gini
+    return gini_core(cost_per_hour, clip=False)
 
 def objective_gini_spatial(aggregate_load, renewable_production, n_households=1220, seed=42):
 
-    np.random.seed(seed)
-
-    n_low = int(n_households * 0.40)
-    n_mid = int(n_households * 0.40)
-    n_high = n_households - n_low - n_mid
-
-    multipliers = np.concatenate([
-        np.random.uniform(0.5, 1.0, n_low),
-        np.random.uniform(0.8, 1.2, n_mid),
-        np.random.uniform(1.2, 2.0, n_high)
-    ])
-    np.random.shuffle(multipliers)
+    multipliers = _get_sorted_multipliers(n_households, seed)
 
     total_re = renewable_production.sum()
     total_load = aggregate_load.sum()
@@ -97,12 +146,7 @@ def objective_gini_spatial(aggregate_load, renewable_production, n_households=12
     if re_frac.sum() == 0:
         return 0.0
 
-    n = len(re_frac)
-    sorted_frac = np.sort(re_frac)
-    index = np.arange(1, n + 1)
-    gini = (2 * np.sum(index * sorted_frac) - (n + 1) * re_frac.sum()) / (n * re_frac.sum())
-
-    return max(0.0, min(gini, 1.0))
+    return gini_sorted(re_frac)
 
 def objective_gini_burden(
     fuel_cost_annual: float,
@@ -112,24 +156,7 @@ def objective_gini_burden(
     burden_cap: float = 0.15
 ) -> float:
 
-    np.random.seed(seed)
-
-    n_low = int(n_households * 0.40)
-    n_mid = int(n_households * 0.40)
-    n_high = n_households - n_low - n_mid
-
-    incomes = np.concatenate([
-        np.random.uniform(18000, 36000, n_low),
-        np.random.uniform(40000, 70000, n_mid),
-        np.random.uniform(70000, 110000, n_high)
-    ])
-
-    consumption = np.concatenate([
-        np.random.uniform(0.7, 1.0, n_low),
-        np.random.uniform(0.9, 1.1, n_mid),
-        np.random.uniform(1.1, 1.4, n_high)
-    ])
-    consumption_shares = consumption / consumption.sum()
+    incomes, consumption_shares = _get_burden_profile(n_households, seed)
 
     fuel_per_hh = fuel_cost_annual / n_households
     capital_per_hh = capital_cost_annual * consumption_shares
@@ -140,15 +167,10 @@ def objective_gini_burden(
 
     affordability = np.clip(1.0 - burden, 0.0, 1.0)
 
-    n = len(affordability)
     if affordability.sum() == 0:
         return 1.0
 
-    sorted_aff = np.sort(affordability)
-    index = np.arange(1, n + 1)
-    gini = (2 * np.sum(index * sorted_aff) - (n + 1) * affordability.sum()) / (n * affordability.sum())
-
-    return max(0.0, min(gini, 1.0))
+    return gini_core(affordability)
 
 def objective_gini_theja(
     total_re_mwh: float,
@@ -157,19 +179,9 @@ def objective_gini_theja(
     seed: int = 42
 ) -> float:
 
-    np.random.seed(seed)
-
     re_ratio = total_re_mwh / total_load_mwh if total_load_mwh > 0 else 0.0
 
-    n_low = int(n_households * 0.40)
-    n_mid = int(n_households * 0.40)
-    n_high = n_households - n_low - n_mid
-
-    capture_low = np.random.uniform(0.3, 0.6, n_low)
-    capture_mid = np.random.uniform(0.7, 1.1, n_mid)
-    capture_high = np.random.uniform(1.2, 2.0, n_high)
-
-    capture = np.concatenate([capture_low, capture_mid, capture_high])
+    capture = _get_sorted_capture(n_households, seed)
 
     scarcity = np.clip(1.0 - re_ratio, 0.0, 1.0)
 
@@ -184,9 +196,4 @@ def objective_gini_theja(
     if benefit.sum() == 0:
         return 1.0
 
-    n = len(benefit)
-    sorted_benefit = np.sort(benefit)
-    index = np.arange(1, n + 1)
-    gini = (2 * np.sum(index * sorted_benefit) - (n + 1) * benefit.sum()) / (n * benefit.sum())
-
-    return max(0.0, min(gini, 1.0))
+    return gini_sorted(benefit)
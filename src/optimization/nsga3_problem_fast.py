@@ -1,4 +1,5 @@
 from pymoo.core.problem import Problem
+from collections import OrderedDict
 import numpy as np
 from pathlib import Path
 import sys
@@ -7,15 +8,18 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 from simulation.data_cache import get_data_cache
-from simulation.system_simulator_fast import simulate_system_fast
+from simulation.system_simulator_fast import simulate_system_fast, simulate_system_batch
 
 try:
-    from joblib import Parallel, delayed
+    from joblib import Parallel, delayed, effective_n_jobs
     JOBLIB_AVAILABLE = True
 except ImportError:
     JOBLIB_AVAILABLE = False
     print("[WARN] joblib not available, using sequential evaluation")
 
+EVAL_CACHE_SIZE = 50000
+MAX_BATCH_ROWS = 32
+
 class MicrogridOptimizationProblemFast(Problem):
 
     def __init__(self, system_config, n_jobs=-1):
@@ -26,6 +30,8 @@ class MicrogridOptimizationProblemFast(Problem):
         self.data_cache = get_data_cache()
         self.data_cache.initialize(system_config)
 
+        self._eval_cache = OrderedDict()
+
         n_var = 4
 
         bounds = system_config.get('bounds', {
@@ -53,7 +59,7 @@ class MicrogridOptimizationProblemFast(Problem):
         n_constr = 6
 
         super().__init__(n_var=n_var, n_obj=n_obj, n_ieq_constr=n_constr,
-                         xl=xl, xu=xu)
+                         xl=xl, xu=xu, exclude_from_serialization=['_eval_cache'])
 
     def _evaluate_single(self, x):
 
@@ -75,38 +81,59 @@ class MicrogridOptimizationProblemFast(Problem):
             objectives['gini']
         ])
 
-        g = np.array([
-            constraints['bounds'],
-            constraints['area'],
-            constraints['lpsp'],
-            constraints['spinning_reserve'],
-            constraints['grid_limits'],
-            constraints['renewable_cap']
-        ])
+        g = constraints['violations']
 
         return f, g
 
+    def _evaluate_batch(self, X):
+
+        return simulate_system_batch(X, self.system_config, self.data_cache)
+
     def _evaluate(self, X, out, *args, **kwargs):
 
         n_pop = X.shape[0]
 
-        if JOBLIB_AVAILABLE and self.n_jobs != 1:
+        F = np.zeros((n_pop, self.n_obj))
+        G = np.zeros((n_pop, self.n_ieq_constr))
+
+        if self._eval_cache is None:
+            self._eval_cache = OrderedDict()
+
+        keys = [X[i].tobytes() for i in range(n_pop)]
+        missing = {}
+        for i, key in enumerate(keys):
+            cached = self._eval_cache.get(key)
+            if cached is None:
+                missing.setdefault(key, i)
+            else:
+                self._eval_cache.move_to_end(key)
+                F[i], G[i] = cached
+
+        rows = np.fromiter(missing.values(), dtype=np.intp, count=len(missing))
+
+        n_workers = effective_n_jobs(self.n_jobs) if JOBLIB_AVAILABLE else 1
+        n_chunks = min(len(rows), max(n_workers, -(-len(rows) // MAX_BATCH_ROWS)))
+        chunks = np.array_split(rows, n_chunks) if n_chunks > 0 else []
+
+        if n_workers > 1 and n_chunks > 1:
 
             results = Parallel(n_jobs=self.n_jobs, backend="loky")(
-                delayed(self._evaluate_single)(X[i]) for i in range(n_pop)
+                delayed(self._evaluate_batch)(X[chunk]) for chunk in chunks
             )
-
-            F = np.array([r[0] for r in results])
-            G = np.array([r[1] for r in results])
         else:
 
-            F = np.zeros((n_pop, self.n_obj))
-            G = np.zeros((n_pop, self.n_ieq_constr))
+            results = [self._evaluate_batch(X[chunk]) for chunk in chunks]
+
+        for chunk, (F_chunk, G_chunk) in zip(chunks, results):
+            for i, f, g in zip(chunk, F_chunk, G_chunk):
+                self._eval_cache[keys[i]] = (f, g)
+
+        for i, key in enumerate(keys):
+            if key in missing:
+                F[i], G[i] = self._eval_cache[key]
 
-            for i in range(n_pop):
-                f, g = self._evaluate_single(X[i])
-                F[i] = f
-                G[i] = g
+        while len(self._eval_cache) > EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)
 
         out["F"] = F
         out["G"] = G
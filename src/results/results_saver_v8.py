@@ -22,24 +22,38 @@ References:
 - rules.md Section 9: "NUNCA gerar gráficos sem preservar dados raw subjacentes"
 """
 
-import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+from utils.io_helpers import write_json
 
-class NumpyEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if isinstance(obj, Path):
-            return str(obj)
-        return super().default(obj)
+
+def _column_stats(values, names):
+    """
+    Summarize each column of a matrix with min, max, mean and std.
+
+    Args:
+        values: Array of shape (n_solutions, len(names))
+        names: Column names, in column order
+
+    Returns:
+        Dict mapping each name to its {'min', 'max', 'mean', 'std'} floats
+    """
+    values = np.asarray(values, dtype=np.float64)
+    mins, maxs = values.min(axis=0), values.max(axis=0)
+    means, stds = values.mean(axis=0), values.std(axis=0)
+
+    return {
+        name: {
+            'min': float(mins[k]),
+            'max': float(maxs[k]),
+            'mean': float(means[k]),
+            'std': float(stds[k])
+        }
+        for k, name in enumerate(names)
+    }
 
 
 def save_v8_results(
@@ -67,7 +81,7 @@ def save_v8_results(
         config: V8 configuration dict
         bounds: Decision variable bounds
         metrics_history: List of dicts from callback (HV, IGD+, SP, DIV per generation)
-        pareto_metrics: List of dicts with all metrics per solution
+        pareto_metrics: ParetoFrontMetrics with one array per metric
         F: Objectives matrix (n_solutions, 4)
         X: Decision variables matrix (n_solutions, 4)
         G: Constraints matrix (n_solutions, 6)
@@ -98,7 +112,7 @@ def save_v8_results(
     df_convergence = pd.DataFrame(metrics_history)
     df_convergence.to_csv(results_dir / 'convergence-metrics.csv', index=False)
 
-    df_pareto = pd.DataFrame(pareto_metrics)
+    df_pareto = pareto_metrics.to_dataframe()
     df_pareto.to_csv(results_dir / 'pareto-front-solutions.csv', index=False)
 
     initial_metrics = metrics_history[0]
@@ -107,6 +121,9 @@ def save_v8_results(
     hv_values = [m['hypervolume'] for m in metrics_history]
     igd_values = [m['igd_plus'] for m in metrics_history if m['igd_plus'] != np.inf]
 
+    additional_names = ['re_penetration_pct', 'excess_power_pct',
+                        'lcoe_cad_per_kwh', 'fuel_consumption_liters']
+
     summary = {
         'run_info': {
             'run_id': run_id,
@@ -153,89 +170,16 @@ def save_v8_results(
         },
         'pareto_front': {
             'n_solutions': len(pareto_metrics),
-            'n_feasible': sum(1 for s in pareto_metrics if s['is_feasible']),
-            'objectives': {
-                'npc_cad': {
-                    'min': float(np.min(F[:, 0])),
-                    'max': float(np.max(F[:, 0])),
-                    'mean': float(np.mean(F[:, 0])),
-                    'std': float(np.std(F[:, 0]))
-                },
-                'lpsp': {
-                    'min': float(np.min(F[:, 1])),
-                    'max': float(np.max(F[:, 1])),
-                    'mean': float(np.mean(F[:, 1])),
-                    'std': float(np.std(F[:, 1]))
-                },
-                'co2_kg': {
-                    'min': float(np.min(F[:, 2])),
-                    'max': float(np.max(F[:, 2])),
-                    'mean': float(np.mean(F[:, 2])),
-                    'std': float(np.std(F[:, 2]))
-                },
-                'gini': {
-                    'min': float(np.min(F[:, 3])),
-                    'max': float(np.max(F[:, 3])),
-                    'mean': float(np.mean(F[:, 3])),
-                    'std': float(np.std(F[:, 3]))
-                }
-            },
-            'decision_variables': {
-                'pv_kw': {
-                    'min': float(np.min(X[:, 0])),
-                    'max': float(np.max(X[:, 0])),
-                    'mean': float(np.mean(X[:, 0])),
-                    'std': float(np.std(X[:, 0]))
-                },
-                'wind_mw': {
-                    'min': float(np.min(X[:, 1])),
-                    'max': float(np.max(X[:, 1])),
-                    'mean': float(np.mean(X[:, 1])),
-                    'std': float(np.std(X[:, 1]))
-                },
-                'battery_mwh': {
-                    'min': float(np.min(X[:, 2])),
-                    'max': float(np.max(X[:, 2])),
-                    'mean': float(np.mean(X[:, 2])),
-                    'std': float(np.std(X[:, 2]))
-                },
-                'diesel_mw': {
-                    'min': float(np.min(X[:, 3])),
-                    'max': float(np.max(X[:, 3])),
-                    'mean': float(np.mean(X[:, 3])),
-                    'std': float(np.std(X[:, 3]))
-                }
-            },
-            'additional_metrics': {
-                're_penetration_pct': {
-                    'min': min(s['re_penetration_pct'] for s in pareto_metrics),
-                    'max': max(s['re_penetration_pct'] for s in pareto_metrics),
-                    'mean': np.mean([s['re_penetration_pct'] for s in pareto_metrics]),
-                    'std': np.std([s['re_penetration_pct'] for s in pareto_metrics])
-                },
-                'excess_power_pct': {
-                    'min': min(s['excess_power_pct'] for s in pareto_metrics),
-                    'max': max(s['excess_power_pct'] for s in pareto_metrics),
-                    'mean': np.mean([s['excess_power_pct'] for s in pareto_metrics]),
-                    'std': np.std([s['excess_power_pct'] for s in pareto_metrics])
-                },
-                'lcoe_cad_per_kwh': {
-                    'min': min(s['lcoe_cad_per_kwh'] for s in pareto_metrics),
-                    'max': max(s['lcoe_cad_per_kwh'] for s in pareto_metrics),
-                    'mean': np.mean([s['lcoe_cad_per_kwh'] for s in pareto_metrics]),
-                    'std': np.std([s['lcoe_cad_per_kwh'] for s in pareto_metrics])
-                },
-                'fuel_consumption_liters': {
-                    'min': min(s['fuel_consumption_liters'] for s in pareto_metrics),
-                    'max': max(s['fuel_consumption_liters'] for s in pareto_metrics),
-                    'mean': np.mean([s['fuel_consumption_liters'] for s in pareto_metrics]),
-                    'std': np.std([s['fuel_consumption_liters'] for s in pareto_metrics])
-                }
-            }
+            'n_feasible': int(np.count_nonzero(pareto_metrics.is_feasible)),
+            'objectives': _column_stats(F, ['npc_cad', 'lpsp', 'co2_kg', 'gini']),
+            'decision_variables': _column_stats(X, ['pv_kw', 'wind_mw', 'battery_mwh', 'diesel_mw']),
+            'additional_metrics': _column_stats(
+                np.column_stack([getattr(pareto_metrics, name) for name in additional_names]),
+                additional_names
+            )
         }
     }
 
-    with open(results_dir / 'summary.json', 'w') as f:
-        json.dump(summary, f, indent=2, cls=NumpyEncoder)
+    write_json(summary, results_dir / 'summary.json')
 
     return results_dir
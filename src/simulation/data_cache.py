@@ -2,6 +2,11 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 
+def _read_columns(csv_path, columns):
+
+    return pd.read_csv(csv_path, usecols=columns,
+                       dtype={col: np.float64 for col in columns})
+
 class DataCache:
 
     _instance = None
@@ -25,20 +30,23 @@ class DataCache:
 
     def initialize(self, system_config):
 
-        config_hash = hash(str(system_config.get('load_profile_path', '')))
+        config_hash = hash(tuple(
+            str(system_config.get(key, ''))
+            for key in ('load_profile_path', 'solar_cf_path', 'wind_cf_path')
+        ))
 
         if self._config_hash == config_hash and self.load_mw is not None:
             return
 
-        load_df = pd.read_csv(system_config['load_profile_path'])
-        self.load_mw = load_df['Load_MW'].values.astype(np.float64)
+        load_df = _read_columns(system_config['load_profile_path'], ['Load_MW'])
+        self.load_mw = load_df['Load_MW'].to_numpy()
 
-        solar_df = pd.read_csv(system_config['solar_cf_path'])
-        self.solar_cf = solar_df['CF_pv'].values.astype(np.float64)
-        self.temperature_c = solar_df['T_ambient_C'].values.astype(np.float64)
+        solar_df = _read_columns(system_config['solar_cf_path'], ['CF_pv', 'T_ambient_C'])
+        self.solar_cf = solar_df['CF_pv'].to_numpy()
+        self.temperature_c = solar_df['T_ambient_C'].to_numpy()
 
-        wind_df = pd.read_csv(system_config['wind_cf_path'])
-        self.wind_cf = wind_df['CF_wind'].values.astype(np.float64)
+        wind_df = _read_columns(system_config['wind_cf_path'], ['CF_wind'])
+        self.wind_cf = wind_df['CF_wind'].to_numpy()
 
         self._config_hash = config_hash
 
@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
 
 import sys
@@ -12,102 +13,119 @@ from objectives.objective_functions import (
     objective_co2,
     objective_gini_theja
 )
-from constraints.constraint_validator import validate_solution
+from constraints.constraint_functions import make_constraint_area
+from constraints.constraint_validator import (
+    validate_population,
+    validate_solution,
+    CONSTRAINT_NAMES
+)
+from utils.numba_compat import njit
 
-def simulate_system_fast(decision_vars, system_config, data_cache=None):
+@lru_cache(maxsize=None)
+def _get_area_constraint(area_available_pv_m2, area_available_wind_m2):
 
-    if data_cache is None:
-        data_cache = get_data_cache()
-        data_cache.initialize(system_config)
+    return make_constraint_area({
+        'area_pv_per_kw': 2.0,
+        'area_wind_per_mw': 186050.0,
+        'area_battery_per_mwh': 10.0,
+        'area_available_pv_m2': area_available_pv_m2,
+        'area_available_wind_m2': area_available_wind_m2
+    })
 
-    load_mw, solar_cf, wind_cf, temperature_c = data_cache.get_arrays()
+@njit(cache=True)
+def _dispatch_batch(load_mw, renewable_mw, battery_mwh, diesel_mw,
+                    battery_efficiency, battery_c_rate, battery_dod_max, heat_rate):
+
+    n_pop, n_hours = renewable_mw.shape
+    diesel_gen_mw = np.zeros((n_pop, n_hours))
+    diesel_fuel_mmbtu = np.zeros((n_pop, n_hours))
+    battery_charge_mw = np.zeros((n_pop, n_hours))
+    battery_discharge_mw = np.zeros((n_pop, n_hours))
+    deficit_mw = np.zeros((n_pop, n_hours))
+    soc = np.zeros((n_pop, n_hours))
+
+    for i in range(n_pop):
+        capacity = battery_mwh[i]
+        diesel_cap = diesel_mw[i]
+
+        if capacity > 0:
+            battery_p_max = capacity * battery_c_rate
+            soc_min = 1.0 - battery_dod_max
+        else:
+            battery_p_max = 0.0
+            soc_min = 0.0
 
-    pv_kw = decision_vars['n_pv_kw']
-    wind_mw = decision_vars['n_wind_mw']
-    battery_mwh = decision_vars['e_battery_mwh']
-    diesel_mw = decision_vars['p_diesel_mw']
+        current_soc = 0.5
 
-    battery_efficiency = system_config['battery_efficiency']
-    battery_c_rate = system_config['battery_c_rate']
-    battery_dod_max = system_config['battery_dod_max']
-    diesel_efficiency = system_config['diesel_efficiency']
-    diesel_min_load = system_config['diesel_min_load_fraction']
-    fuel_cost_per_mmbtu = system_config['diesel_fuel_cost_per_mmbtu']
+        for t in range(n_hours):
+            load_t = load_mw[t]
+            re_t = renewable_mw[i, t]
 
-    temp_coeff = -0.004
-    pv_gen_mw = (pv_kw / 1000.0) * solar_cf * (1.0 + temp_coeff * (temperature_c - 25.0))
-    pv_gen_mw = np.maximum(pv_gen_mw, 0.0)
+            if re_t >= load_t:
 
-    wind_gen_mw = wind_mw * wind_cf
+                excess = re_t - load_t
+                if capacity > 0 and current_soc < 1.0:
+                    charge_capacity = min(battery_p_max, (1.0 - current_soc) * capacity / battery_efficiency)
+                    actual_charge = min(excess, charge_capacity)
+                    battery_charge_mw[i, t] = actual_charge
+                    current_soc += (actual_charge * battery_efficiency) / capacity
+                    current_soc = min(current_soc, 1.0)
+            else:
 
-    renewable_mw = pv_gen_mw + wind_gen_mw
+                shortfall = load_t - re_t
 
-    if battery_mwh > 0:
-        battery_p_max = battery_mwh * battery_c_rate
-        battery_usable = battery_mwh * battery_dod_max
-        soc_min = 1.0 - battery_dod_max
-    else:
-        battery_p_max = 0.0
-        battery_usable = 0.0
-        soc_min = 0.0
-
-    n_hours = len(load_mw)
-    diesel_gen_mw = np.zeros(n_hours)
-    diesel_fuel_mmbtu = np.zeros(n_hours)
-    battery_charge_mw = np.zeros(n_hours)
-    battery_discharge_mw = np.zeros(n_hours)
-    deficit_mw = np.zeros(n_hours)
-    soc = np.zeros(n_hours)
-
-    current_soc = 0.5
-
-    for t in range(n_hours):
-        load_t = load_mw[t]
-        re_t = renewable_mw[t]
-
-        if re_t >= load_t:
-
-            excess = re_t - load_t
-            if battery_mwh > 0 and current_soc < 1.0:
-                charge_capacity = min(battery_p_max, (1.0 - current_soc) * battery_mwh / battery_efficiency)
-                actual_charge = min(excess, charge_capacity)
-                battery_charge_mw[t] = actual_charge
-                current_soc += (actual_charge * battery_efficiency) / battery_mwh
-                current_soc = min(current_soc, 1.0)
-        else:
+                if capacity > 0 and current_soc > soc_min:
+                    available_energy = (current_soc - soc_min) * capacity
+                    discharge_capacity = min(battery_p_max, available_energy)
+                    actual_discharge = min(shortfall, discharge_capacity)
+                    battery_discharge_mw[i, t] = actual_discharge
+                    current_soc -= actual_discharge / capacity
+                    current_soc = max(current_soc, soc_min)
+                    shortfall -= actual_discharge
 
-            shortfall = load_t - re_t
+                if shortfall > 0 and diesel_cap > 0:
+                    diesel_output = min(shortfall, diesel_cap)
+                    diesel_gen_mw[i, t] = diesel_output
+                    diesel_fuel_mmbtu[i, t] = diesel_output * heat_rate
 
-            if battery_mwh > 0 and current_soc > soc_min:
-                available_energy = (current_soc - soc_min) * battery_mwh
-                discharge_capacity = min(battery_p_max, available_energy)
-                actual_discharge = min(shortfall, discharge_capacity)
-                battery_discharge_mw[t] = actual_discharge
-                current_soc -= actual_discharge / battery_mwh
-                current_soc = max(current_soc, soc_min)
-                shortfall -= actual_discharge
+                    shortfall -= diesel_output
 
-            if shortfall > 0 and diesel_mw > 0:
-                diesel_output = min(shortfall, diesel_mw)
-                diesel_gen_mw[t] = diesel_output
+                if shortfall > 0:
+                    deficit_mw[i, t] = shortfall
 
-                heat_rate = 3.412 / diesel_efficiency
-                fuel = diesel_output * heat_rate * 1.0
-                diesel_fuel_mmbtu[t] = fuel
+            soc[i, t] = current_soc
 
-                shortfall -= diesel_output
+    return (diesel_gen_mw, diesel_fuel_mmbtu, battery_charge_mw,
+            battery_discharge_mw, deficit_mw, soc)
 
-            if shortfall > 0:
-                deficit_mw[t] = shortfall
+def _generation_batch(pv_kw, wind_mw, data_cache):
 
-        soc[t] = current_soc
+    load_mw, solar_cf, wind_cf, temperature_c = data_cache.get_arrays()
 
-    total_load_mwh = load_mw.sum()
-    total_pv_mwh = pv_gen_mw.sum()
-    total_wind_mwh = wind_gen_mw.sum()
-    total_diesel_mwh = diesel_gen_mw.sum()
-    total_diesel_fuel = diesel_fuel_mmbtu.sum()
-    total_deficit_mwh = deficit_mw.sum()
+    temp_coeff = -0.004
+    pv_gen_mw = (pv_kw[:, None] / 1000.0) * solar_cf * (1.0 + temp_coeff * (temperature_c - 25.0))
+    pv_gen_mw = np.maximum(pv_gen_mw, 0.0)
+
+    wind_gen_mw = wind_mw[:, None] * wind_cf
+
+    return load_mw, pv_gen_mw, wind_gen_mw
+
+def _run_dispatch(load_mw, renewable_mw, battery_mwh, diesel_mw, system_config):
+
+    return _dispatch_batch(
+        load_mw, renewable_mw,
+        np.ascontiguousarray(battery_mwh, dtype=np.float64),
+        np.ascontiguousarray(diesel_mw, dtype=np.float64),
+        float(system_config['battery_efficiency']),
+        float(system_config['battery_c_rate']),
+        float(system_config['battery_dod_max']),
+        3.412 / system_config['diesel_efficiency']
+    )
+
+def _objectives(pv_kw, wind_mw, battery_mwh, diesel_mw, total_load_mwh, total_re_mwh,
+                total_diesel_fuel, total_deficit_mwh, system_config):
+
+    fuel_cost_per_mmbtu = system_config['diesel_fuel_cost_per_mmbtu']
 
     capital_cost = (
         pv_kw * system_config['pv_capital_cost_per_kw'] +
@@ -146,27 +164,28 @@ def simulate_system_fast(decision_vars, system_config, data_cache=None):
     }
     co2_value = objective_co2(dispatch_for_co2, system_config['lifetime_years'])
 
-    total_re_mwh = total_pv_mwh + total_wind_mwh
     gini_value = objective_gini_theja(
         total_re_mwh=total_re_mwh,
         total_load_mwh=total_load_mwh,
         n_households=1220
     )
 
-    objectives = {
+    return {
         'npc': npc_value,
         'lpsp': lpsp_value,
         'co2': co2_value,
         'gini': gini_value
     }
 
+def _constraint_inputs(decision_vars, battery_p_max, total_load_mwh, system_config):
+
     x_for_constraints = {
         **decision_vars,
-        'p_diesel_online_mw': diesel_mw,
+        'p_diesel_online_mw': decision_vars['p_diesel_mw'],
         'p_battery_discharge_mw': battery_p_max,
         'p_load_avg_mw': total_load_mwh / 8760.0,
-        'p_pv_installed_kw': pv_kw,
-        'p_wind_installed_mw': wind_mw,
+        'p_pv_installed_kw': decision_vars['n_pv_kw'],
+        'p_wind_installed_mw': decision_vars['n_wind_mw'],
         'p_grid_buy_mw': 0.0,
         'p_grid_sell_mw': 0.0,
         'grid_connected': system_config['grid_connected']
@@ -179,27 +198,126 @@ def simulate_system_fast(decision_vars, system_config, data_cache=None):
         'p_diesel_mw': (0, 10)
     })
 
-    area_params = {
-        'area_pv_per_kw': 2.0,
-        'area_wind_per_mw': 186050.0,
-        'area_battery_per_mwh': 10.0,
-        'area_available_pv_m2': system_config['area_available_pv_m2'],
-        'area_available_wind_m2': system_config['area_available_wind_m2']
+    area_fn = _get_area_constraint(
+        system_config['area_available_pv_m2'],
+        system_config['area_available_wind_m2']
+    )
+
+    return x_for_constraints, bounds, area_fn
+
+def simulate_system_batch(X, system_config, data_cache=None):
+
+    if data_cache is None:
+        data_cache = get_data_cache()
+        data_cache.initialize(system_config)
+
+    X = np.asarray(X, dtype=np.float64)
+    pv_kw, wind_mw, battery_mwh, diesel_mw = X.T
+
+    load_mw, pv_gen_mw, wind_gen_mw = _generation_batch(pv_kw, wind_mw, data_cache)
+    renewable_mw = pv_gen_mw + wind_gen_mw
+
+    diesel_gen_mw, diesel_fuel_mmbtu, _, _, deficit_mw, _ = _run_dispatch(
+        load_mw, renewable_mw, battery_mwh, diesel_mw, system_config
+    )
+
+    total_load_mwh = load_mw.sum()
+    total_re_mwh = pv_gen_mw.sum(axis=1) + wind_gen_mw.sum(axis=1)
+    total_diesel_fuel = diesel_fuel_mmbtu.sum(axis=1)
+    total_deficit_mwh = deficit_mw.sum(axis=1)
+
+    F = np.empty((X.shape[0], 4))
+    for i in range(X.shape[0]):
+        objectives = _objectives(
+            pv_kw[i], wind_mw[i], battery_mwh[i], diesel_mw[i], total_load_mwh,
+            total_re_mwh[i], total_diesel_fuel[i], total_deficit_mwh[i], system_config
+        )
+        F[i] = (objectives['npc'], objectives['lpsp'], objectives['co2'], objectives['gini'])
+
+    decision_vars = {
+        'n_pv_kw': pv_kw,
+        'n_wind_mw': wind_mw,
+        'e_battery_mwh': battery_mwh,
+        'p_diesel_mw': diesel_mw
     }
+    battery_p_max = np.where(battery_mwh > 0, battery_mwh * system_config['battery_c_rate'], 0.0)
+    x_for_constraints, bounds, area_fn = _constraint_inputs(
+        decision_vars, battery_p_max, total_load_mwh, system_config
+    )
+
+    _, _, G = validate_population(
+        x_for_constraints, bounds, None, {'lpsp': F[:, 1]},
+        {'renewable_fraction_max': system_config['renewable_fraction_max']},
+        {'p_max_import_mw': 0.0, 'p_max_export_mw': 0.0},
+        system_config['reserve_fraction'], system_config['lpsp_limit'],
+        area_fn=area_fn
+    )
+
+    return F, G
+
+def simulate_system_fast(decision_vars, system_config, data_cache=None):
+
+    if data_cache is None:
+        data_cache = get_data_cache()
+        data_cache.initialize(system_config)
+
+    pv_kw = decision_vars['n_pv_kw']
+    wind_mw = decision_vars['n_wind_mw']
+    battery_mwh = decision_vars['e_battery_mwh']
+    diesel_mw = decision_vars['p_diesel_mw']
+
+    load_mw, pv_gen_mw, wind_gen_mw = _generation_batch(
+        np.array([pv_kw], dtype=np.float64), np.array([wind_mw], dtype=np.float64), data_cache
+    )
+    pv_gen_mw = pv_gen_mw[0]
+    wind_gen_mw = wind_gen_mw[0]
+
+    renewable_mw = pv_gen_mw + wind_gen_mw
+
+    if battery_mwh > 0:
+        battery_p_max = battery_mwh * system_config['battery_c_rate']
+    else:
+        battery_p_max = 0.0
+
+    (diesel_gen_mw, diesel_fuel_mmbtu, battery_charge_mw,
+     battery_discharge_mw, deficit_mw, soc) = [
+        hourly[0] for hourly in _run_dispatch(
+            load_mw, renewable_mw[None, :], [battery_mwh], [diesel_mw], system_config
+        )
+    ]
+
+    total_load_mwh = load_mw.sum()
+    total_pv_mwh = pv_gen_mw.sum()
+    total_wind_mwh = wind_gen_mw.sum()
+    total_diesel_mwh = diesel_gen_mw.sum()
+    total_diesel_fuel = diesel_fuel_mmbtu.sum()
+    total_deficit_mwh = deficit_mw.sum()
+
+    objectives = _objectives(
+        pv_kw, wind_mw, battery_mwh, diesel_mw, total_load_mwh,
+        total_pv_mwh + total_wind_mwh, total_diesel_fuel, total_deficit_mwh, system_config
+    )
+    lpsp_value = objectives['lpsp']
+
+    x_for_constraints, bounds, area_fn = _constraint_inputs(
+        decision_vars, battery_p_max, total_load_mwh, system_config
+    )
 
     simulation_results = {'lpsp': lpsp_value}
     policy = {'renewable_fraction_max': system_config['renewable_fraction_max']}
     grid_limits = {'p_max_import_mw': 0.0, 'p_max_export_mw': 0.0}
 
     is_feasible, total_cv, violations = validate_solution(
-        x_for_constraints, bounds, area_params, simulation_results, policy,
-        grid_limits, system_config['reserve_fraction'], system_config['lpsp_limit']
+        x_for_constraints, bounds, None, simulation_results, policy,
+        grid_limits, system_config['reserve_fraction'], system_config['lpsp_limit'],
+        area_fn=area_fn
     )
 
     constraints = {
         'is_feasible': is_feasible,
         'total_violation': total_cv,
-        **violations
+        'violations': violations,
+        **dict(zip(CONSTRAINT_NAMES, violations.tolist()))
     }
 
     dispatch_summary = {
@@ -0,0 +1,2 @@
+from .numba_compat import njit, prange, NUMBA_AVAILABLE, FASTMATH_FLAGS
+from .io_helpers import write_json
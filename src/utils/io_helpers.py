@@ -0,0 +1,31 @@
+"""
+Shared JSON writer for run outputs.
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+
+class NumpyEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, Path):
+            return str(obj)
+        return super().default(obj)
+
+
+def write_json(data, path):
+    """
+    Write data as indented JSON, keeping inf/nan as Infinity/NaN.
+
+    Args:
+        data: JSON-compatible dict (numpy scalars/arrays and Paths allowed)
+        path: Output file path
+    """
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, cls=NumpyEncoder)
@@ -127,8 +127,7 @@ def plot_parallel_coordinates(
 
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    for idx in range(len(df_norm)):
-        ax.plot(range(len(obj_cols)), df_norm.iloc[idx], alpha=0.5, linewidth=1)
+    ax.plot(range(len(obj_cols)), df_norm.to_numpy().T, alpha=0.5, linewidth=1)
 
     ax.set_xticks(range(len(obj_cols)))
     ax.set_xticklabels(['NPC', 'LPSP', 'CO2', 'Gini'], fontsize=12)
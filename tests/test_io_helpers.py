@@ -0,0 +1,36 @@
+import json
+import math
+
+import numpy as np
+
+from utils.io_helpers import write_json
+
+
+def test_write_json_round_trips_non_finite(tmp_path):
+    summary = {
+        'convergence': {
+            'initial': {'igd_plus': float('inf')},
+            'final': {'igd_plus': np.float64(np.inf), 'spacing': float('nan')}
+        },
+        'values': np.array([1.0, -np.inf]),
+        'n_solutions': np.int64(3)
+    }
+    path = tmp_path / 'summary.json'
+
+    write_json(summary, path)
+    loaded = json.loads(path.read_text())
+
+    assert loaded['convergence']['initial']['igd_plus'] == math.inf
+    assert loaded['convergence']['final']['igd_plus'] == math.inf
+    assert math.isnan(loaded['convergence']['final']['spacing'])
+    assert loaded['values'] == [1.0, -math.inf]
+    assert loaded['n_solutions'] == 3
+
+
+def test_write_json_finite_payload(tmp_path):
+    summary = {'hv': np.float64(1.5), 'front': np.array([[1, 2], [3, 4]])}
+    path = tmp_path / 'summary.json'
+
+    write_json(summary, path)
+
+    assert json.loads(path.read_text()) == {'hv': 1.5, 'front': [[1, 2], [3, 4]]}
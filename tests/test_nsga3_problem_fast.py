@@ -0,0 +1,41 @@
+import copy
+import pickle
+
+import numpy as np
+
+from config import get_v8_config
+from optimization.nsga3_problem_fast import MicrogridOptimizationProblemFast
+
+
+def _population(problem, n=6):
+    rng = np.random.default_rng(0)
+    return problem.xl + rng.random((n, problem.n_var)) * (problem.xu - problem.xl)
+
+
+def test_evaluate_after_deepcopy_and_pickle():
+    problem = MicrogridOptimizationProblemFast(get_v8_config(), n_jobs=1)
+    X = _population(problem)
+    expected = problem.evaluate(X, return_as_dictionary=True)
+
+    for clone in (copy.deepcopy(problem), pickle.loads(pickle.dumps(problem))):
+        assert clone._eval_cache is None
+        out = clone.evaluate(X, return_as_dictionary=True)
+        np.testing.assert_array_equal(out['F'], expected['F'])
+        np.testing.assert_array_equal(out['G'], expected['G'])
+        assert len(clone._eval_cache) == len(X)
+
+
+def test_cached_rows_match_fresh_evaluation():
+    problem = MicrogridOptimizationProblemFast(get_v8_config(), n_jobs=1)
+    X = _population(problem)
+    X[3] = X[0]
+
+    first = problem.evaluate(X, return_as_dictionary=True)
+    second = problem.evaluate(X, return_as_dictionary=True)
+
+    for i, x in enumerate(X):
+        f, g = problem._evaluate_single(x)
+        np.testing.assert_array_equal(first['F'][i], f)
+        np.testing.assert_array_equal(first['G'][i], g)
+    np.testing.assert_array_equal(first['F'], second['F'])
+    assert len(problem._eval_cache) == len(X) - 1